@@ -1,57 +1,67 @@
+import os
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import List, Dict
 from document_processor import DocumentProcessor
 from persona_analyzer import PersonaAnalyzer
 from output_formatter import OutputFormatter
 
-def main():
-    parser = argparse.ArgumentParser(description='Persona-Driven Document Intelligence')
-    parser.add_argument('--documents', nargs='+', required=True, help='Paths to PDF documents')
-    parser.add_argument('--persona', required=True, help='Persona description')
-    parser.add_argument('--job', required=True, help='Job-to-be-done description')
-    parser.add_argument('--output', default='output.json', help='Output JSON file path')
-    
-    args = parser.parse_args()
-    
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder writes identical output
+    orjson = None
+
+def process(documents: List[str], persona: str, job: str, output: str = 'output.json') -> Dict:
+    """Run the full pipeline over documents and save the result JSON to output"""
     # Initialize components
     doc_processor = DocumentProcessor()
     persona_analyzer = PersonaAnalyzer()
     output_formatter = OutputFormatter()
     
-    # Process documents
+    # Process documents (each PDF is independent, so extract them in parallel)
     print("Processing documents...")
     extracted_sections = []
     
-    for doc_path in args.documents:
+    for doc_path in documents:
         print(f"Processing: {doc_path}")
-        sections = doc_processor.extract_sections(doc_path)
+    
+    max_workers = min(len(documents), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(doc_processor.extract_sections, documents))
+    else:
+        results = [doc_processor.extract_sections(doc_path) for doc_path in documents]
+    
+    for sections in results:
         extracted_sections.extend(sections)
     
     # Analyze with persona context
     print("Analyzing with persona context...")
     ranked_sections = persona_analyzer.rank_sections(
         extracted_sections, 
-        args.persona, 
-        args.job
+        persona, 
+        job,
+        top_k=15  # Only the top 15 sections are written out
     )
     
     # Generate subsection analysis
     print("Generating subsection analysis...")
     refined_subsections = persona_analyzer.analyze_subsections(
         ranked_sections[:10],  # Top 10 sections
-        args.persona,
-        args.job
+        persona,
+        job
     )
     
     # Format output (this will generate a fresh timestamp)
     print("Formatting output...")
     print(f"Current time: {datetime.now().isoformat()}")
     output_data = output_formatter.format_output(
-        documents=args.documents,
-        persona=args.persona,
-        job=args.job,
+        documents=documents,
+        persona=persona,
+        job=job,
         sections=ranked_sections,
         subsections=refined_subsections
     )
@@ -60,12 +70,29 @@ def main():
     print(f"Generated timestamp: {output_data['metadata']['processing_timestamp']}")
     
     # Save output immediately after formatting
-    print(f"Saving output to: {args.output}")
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    print(f"Saving output to: {output}")
+    if orjson is not None:
+        with open(output, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
     
     print(f"Processing completed at: {output_data['metadata']['processing_timestamp']}")
-    print(f"Output saved to: {args.output}")
+    print(f"Output saved to: {output}")
+    
+    return output_data
+
+def main():
+    parser = argparse.ArgumentParser(description='Persona-Driven Document Intelligence')
+    parser.add_argument('--documents', nargs='+', required=True, help='Paths to PDF documents')
+    parser.add_argument('--persona', required=True, help='Persona description')
+    parser.add_argument('--job', required=True, help='Job-to-be-done description')
+    parser.add_argument('--output', default='output.json', help='Output JSON file path')
+    
+    args = parser.parse_args()
+    
+    process(args.documents, args.persona, args.job, args.output)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
+import ast
 import json
 from datetime import datetime
+from pathlib import PureWindowsPath
 from typing import List, Dict
 from persona_analyzer import RankedSection, RefinedSubsection
 
@@ -13,7 +15,7 @@ class OutputFormatter:
         # Clean up job description if it's in dictionary format
         if isinstance(job, str) and job.startswith('{') and job.endswith('}'):
             try:
-                job_dict = eval(job)
+                job_dict = ast.literal_eval(job)
                 if isinstance(job_dict, dict) and 'task' in job_dict:
                     job = job_dict['task']
             except:
@@ -21,7 +23,7 @@ class OutputFormatter:
         
         output = {
             "metadata": {
-                "input_documents": [doc.split('/')[-1].split('\\')[-1] + ('.pdf' if not doc.endswith('.pdf') else '') for doc in documents],
+                "input_documents": [self._document_file_name(doc) for doc in documents],
                 "persona": persona,
                 "job_to_be_done": job,
                 "processing_timestamp": timestamp  # Fresh timestamp every time
@@ -56,3 +58,8 @@ class OutputFormatter:
             })
         
         return output
+    
+    def _document_file_name(self, doc: str) -> str:
+        """Base file name of an input path (either separator), with a .pdf extension"""
+        name = PureWindowsPath(doc).name
+        return name if name.lower().endswith('.pdf') else name + '.pdf'
@@ -1,11 +1,44 @@
 import re
-from typing import List, Dict, Tuple
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Dict, Tuple, Optional, FrozenSet, Set
 from collections import Counter
 from dataclasses import dataclass
 from document_processor import DocumentSection
 
+# Hot-path patterns compiled once at import
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Terms counted towards a section's technical density
+TECHNICAL_INDICATORS = frozenset(['analysis', 'research', 'study', 'method', 'result', 'data'])
+
+# Persona-specific keywords and priorities
+PERSONA_KEYWORDS = {
+    'researcher': ['methodology', 'experiment', 'data', 'analysis', 'hypothesis', 'study', 'research'],
+    'student': ['concept', 'definition', 'example', 'theory', 'principle', 'formula', 'equation'],
+    'analyst': ['trend', 'performance', 'metric', 'benchmark', 'comparison', 'forecast', 'insight'],
+    'entrepreneur': ['market', 'opportunity', 'strategy', 'business', 'revenue', 'growth', 'innovation'],
+    'journalist': ['fact', 'source', 'evidence', 'quote', 'statement', 'report', 'investigation'],
+    'travel': ['destination', 'place', 'location', 'visit', 'culture', 'experience', 'attraction']
+}
+
+PERSONA_KEYWORD_SETS = {p: frozenset(kws) for p, kws in PERSONA_KEYWORDS.items()}
+
+SECTION_PRIORITIES = {
+    'researcher': {'methodology': 0.9, 'results': 0.8, 'analysis': 0.7, 'introduction': 0.6},
+    'student': {'introduction': 0.9, 'summary': 0.8, 'methodology': 0.6, 'conclusion': 0.5},
+    'analyst': {'financial': 0.9, 'results': 0.8, 'analysis': 0.7, 'summary': 0.6},
+    'entrepreneur': {'summary': 0.9, 'analysis': 0.8, 'results': 0.7, 'introduction': 0.5},
+    'journalist': {'summary': 0.9, 'introduction': 0.8, 'results': 0.7, 'analysis': 0.6},
+    'travel': {'summary': 0.9, 'introduction': 0.8, 'general': 0.7, 'analysis': 0.6}
+}
+
 @dataclass
 class RankedSection:
+    __slots__ = ('document_name', 'page_number', 'section_title', 'importance_rank', 'relevance_score', 'content')
+    
     document_name: str
     page_number: int
     section_title: str
@@ -15,80 +48,82 @@ class RankedSection:
 
 @dataclass
 class RefinedSubsection:
+    __slots__ = ('document_name', 'page_number', 'refined_text', 'relevance_explanation')
+    
     document_name: str
     page_number: int
     refined_text: str
     relevance_explanation: str
 
 class PersonaAnalyzer:
-    def __init__(self):
-        # Persona-specific keywords and priorities
-        self.persona_keywords = {
-            'researcher': ['methodology', 'experiment', 'data', 'analysis', 'hypothesis', 'study', 'research'],
-            'student': ['concept', 'definition', 'example', 'theory', 'principle', 'formula', 'equation'],
-            'analyst': ['trend', 'performance', 'metric', 'benchmark', 'comparison', 'forecast', 'insight'],
-            'entrepreneur': ['market', 'opportunity', 'strategy', 'business', 'revenue', 'growth', 'innovation'],
-            'journalist': ['fact', 'source', 'evidence', 'quote', 'statement', 'report', 'investigation'],
-            'travel': ['destination', 'place', 'location', 'visit', 'culture', 'experience', 'attraction']
-        }
-        
-        self.section_priorities = {
-            'researcher': {'methodology': 0.9, 'results': 0.8, 'analysis': 0.7, 'introduction': 0.6},
-            'student': {'introduction': 0.9, 'summary': 0.8, 'methodology': 0.6, 'conclusion': 0.5},
-            'analyst': {'financial': 0.9, 'results': 0.8, 'analysis': 0.7, 'summary': 0.6},
-            'entrepreneur': {'summary': 0.9, 'analysis': 0.8, 'results': 0.7, 'introduction': 0.5},
-            'journalist': {'summary': 0.9, 'introduction': 0.8, 'results': 0.7, 'analysis': 0.6},
-            'travel': {'summary': 0.9, 'introduction': 0.8, 'general': 0.7, 'analysis': 0.6}
-        }
+    def __init__(self, max_workers: int = 1):
+        # Scoring is CPU-bound string work, so it only parallelizes across processes;
+        # pool startup outweighs the gain unless there are thousands of sections
+        self.max_workers = max_workers
     
-    def rank_sections(self, sections: List[DocumentSection], persona: str, job: str) -> List[RankedSection]:
-        scored_sections = []
-        
-        for section in sections:
-            score = self._calculate_relevance_score(section, persona, job)
-            scored_sections.append((section, score))
+    def rank_sections(self, sections: List[DocumentSection], persona: str, job: str,
+                      top_k: Optional[int] = None) -> List[RankedSection]:
+        """Rank sections by relevance; with top_k, only the best top_k are selected and returned"""
+        # Persona and job are fixed for the whole pass, so resolve them once
+        persona_type = self._identify_persona_type(persona)
+        job_keywords = self._extract_keywords_from_job(job)
+        persona_keywords = PERSONA_KEYWORD_SETS.get(persona_type)
+        priorities = SECTION_PRIORITIES.get(persona_type)
+        
+        if self.max_workers > 1 and len(sections) > 1:
+            score_section = partial(self._calculate_relevance_score, persona_keywords=persona_keywords,
+                                    priorities=priorities, job_keywords=job_keywords)
+            chunksize = max(1, len(sections) // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                scores = list(executor.map(score_section, sections, chunksize=chunksize))
+        else:
+            scores = [self._calculate_relevance_score(section, persona_keywords, priorities, job_keywords)
+                      for section in sections]
         
-        # Sort by relevance score
-        scored_sections.sort(key=lambda x: x[1], reverse=True)
+        # Order section indices by relevance score (nlargest keeps the same order as a stable sort)
+        if top_k is not None:
+            order = heapq.nlargest(top_k, range(len(sections)), key=scores.__getitem__)
+        else:
+            order = sorted(range(len(sections)), key=scores.__getitem__, reverse=True)
         
-        # Convert to ranked sections
+        # Convert to ranked sections, in rank order
         ranked_sections = []
-        for rank, (section, score) in enumerate(scored_sections, 1):
+        for rank, i in enumerate(order, 1):
+            section = sections[i]
             ranked_sections.append(RankedSection(
                 document_name=section.document_name,
                 page_number=section.page_number,
                 section_title=section.section_title,
                 importance_rank=rank,
-                relevance_score=score,
+                relevance_score=scores[i],
                 content=section.content
             ))
         
         return ranked_sections
     
-    def _calculate_relevance_score(self, section: DocumentSection, persona: str, job: str) -> float:
+    def _calculate_relevance_score(self, section: DocumentSection, persona_keywords: Optional[FrozenSet[str]],
+                                   priorities: Optional[Dict[str, float]], job_keywords: List[str]) -> float:
+        # persona_keywords and priorities are None for personas without a profile
         score = 0.0
+        content_lower = section.content.lower()
+        tokens = set(_WORD_RE.findall(content_lower))
         
         # Persona-based scoring
-        persona_type = self._identify_persona_type(persona)
-        if persona_type in self.persona_keywords:
-            keywords = self.persona_keywords[persona_type]
-            content_lower = section.content.lower()
-            keyword_matches = sum(1 for keyword in keywords if keyword in content_lower)
+        if persona_keywords is not None:
+            keyword_matches = len(tokens & persona_keywords)
             score += keyword_matches * 0.1
         
         # Section type priority
-        if persona_type in self.section_priorities:
-            section_priority = self.section_priorities[persona_type].get(section.section_type, 0.3)
+        if priorities is not None:
+            section_priority = priorities.get(section.section_type, 0.3)
             score += section_priority
         
-        # Job-specific keyword matching
-        job_keywords = self._extract_keywords_from_job(job)
-        content_lower = section.content.lower()
-        job_matches = sum(1 for keyword in job_keywords if keyword.lower() in content_lower)
+        # Job-specific keyword matching (job keywords are already lowercase)
+        job_matches = sum(1 for keyword in job_keywords if keyword in tokens)
         score += job_matches * 0.15
         
         # Content quality factors
-        score += self._assess_content_quality(section.content)
+        score += self._assess_content_quality(content_lower, tokens)
         
         return score
     
@@ -112,25 +147,24 @@ class PersonaAnalyzer:
     
     def _extract_keywords_from_job(self, job: str) -> List[str]:
         # Extract meaningful keywords from job description
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', job.lower())
+        words = _WORD_RE.findall(job.lower())
         # Filter out common words
         stopwords = {'the', 'and', 'for', 'with', 'given', 'from', 'that', 'this', 'will', 'can', 'should'}
         return [word for word in words if word not in stopwords]
     
-    def _assess_content_quality(self, content: str) -> float:
+    def _assess_content_quality(self, content_lower: str, tokens: Set[str]) -> float:
         # Simple content quality metrics
         quality_score = 0.0
         
         # Length factor (moderate length preferred)
-        length = len(content.split())
+        length = len(content_lower.split())
         if 50 <= length <= 500:
             quality_score += 0.1
         elif 20 <= length <= 1000:
             quality_score += 0.05
         
         # Technical term density
-        technical_indicators = ['analysis', 'research', 'study', 'method', 'result', 'data']
-        tech_count = sum(1 for term in technical_indicators if term in content.lower())
+        tech_count = len(tokens & TECHNICAL_INDICATORS)
         quality_score += min(tech_count * 0.02, 0.1)
         
         return quality_score
@@ -138,9 +172,12 @@ class PersonaAnalyzer:
     def analyze_subsections(self, top_sections: List[RankedSection], persona: str, job: str) -> List[RefinedSubsection]:
         refined_subsections = []
         
+        persona_type = self._identify_persona_type(persona)
+        job_keywords = self._extract_keywords_from_job(job)
+        
         for section in top_sections[:5]:  # Top 5 sections
-            refined_text = self._extract_key_sentences(section.content, persona, job)
-            explanation = self._generate_relevance_explanation(section, persona, job)
+            refined_text = self._extract_key_sentences(section.content, persona_type, job_keywords)
+            explanation = self._generate_relevance_explanation(section, persona_type, job_keywords)
             
             refined_subsections.append(RefinedSubsection(
                 document_name=section.document_name,
@@ -151,10 +188,8 @@ class PersonaAnalyzer:
         
         return refined_subsections
     
-    def _extract_key_sentences(self, content: str, persona: str, job: str) -> str:
-        sentences = re.split(r'[.!?]+', content)
-        job_keywords = self._extract_keywords_from_job(job)
-        persona_type = self._identify_persona_type(persona)
+    def _extract_key_sentences(self, content: str, persona_type: str, job_keywords: List[str]) -> str:
+        sentences = _SENTENCE_SPLIT_RE.split(content)
         
         scored_sentences = []
         for sentence in sentences:
@@ -162,18 +197,16 @@ class PersonaAnalyzer:
                 continue
                 
             score = 0
-            sentence_lower = sentence.lower()
+            tokens = set(_WORD_RE.findall(sentence.lower()))
             
             # Job keyword matching
             for keyword in job_keywords:
-                if keyword.lower() in sentence_lower:
+                if keyword in tokens:
                     score += 1
             
             # Persona keyword matching
-            if persona_type in self.persona_keywords:
-                for keyword in self.persona_keywords[persona_type]:
-                    if keyword in sentence_lower:
-                        score += 0.5
+            if persona_type in PERSONA_KEYWORD_SETS:
+                score += len(tokens & PERSONA_KEYWORD_SETS[persona_type]) * 0.5
             
             scored_sentences.append((sentence.strip(), score))
         
@@ -183,15 +216,14 @@ class PersonaAnalyzer:
         
         return '. '.join(top_sentences) + '.' if top_sentences else content[:200] + '...'
     
-    def _generate_relevance_explanation(self, section: RankedSection, persona: str, job: str) -> str:
+    def _generate_relevance_explanation(self, section: RankedSection, persona_type: str, job_keywords: List[str]) -> str:
         explanations = []
         
-        persona_type = self._identify_persona_type(persona)
         if section.section_title.lower() in ['methodology', 'results', 'analysis']:
             explanations.append(f"Contains {section.section_title.lower()} relevant to {persona_type} work")
         
-        job_keywords = self._extract_keywords_from_job(job)
-        matching_keywords = [kw for kw in job_keywords if kw.lower() in section.content.lower()]
+        tokens = set(_WORD_RE.findall(section.content.lower()))
+        matching_keywords = [kw for kw in job_keywords if kw in tokens]
         if matching_keywords:
             explanations.append(f"Addresses key job requirements: {', '.join(matching_keywords[:3])}")
         
@@ -10,6 +10,7 @@ QUICK START:
 5. Check results in: Output/challenge1b_output.json
 """
 
+import ast
 import subprocess
 import sys
 import json
@@ -142,7 +143,7 @@ def process_documents():
             job = str(job)
     elif isinstance(job, str) and job.startswith('{') and job.endswith('}'):
         try:
-            job_dict = eval(job)
+            job_dict = ast.literal_eval(job)
             if isinstance(job_dict, dict) and 'task' in job_dict:
                 job = job_dict['task']
         except:
@@ -159,28 +160,15 @@ def process_documents():
     output_dir = Path("Output")
     output_file = output_dir / "challenge1b_output.json"
     
-    # Build command with relative paths
+    # Run the pipeline in this interpreter instead of spawning main.py
     pdf_paths = [str(pdf) for pdf in pdf_files]
-    cmd = [
-        sys.executable, "main.py",
-        "--documents"] + pdf_paths + [
-        "--persona", persona,
-        "--job", job,
-        "--output", str(output_file)
-    ]
     
     try:
         print("   🔄 Processing...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode == 0:
-            print(f"   ✅ Completed successfully -> {output_file}")
-            print(f"   📊 Results saved to: Output/challenge1b_output.json")
-        else:
-            print(f"   ❌ Failed: {result.stderr}")
-            if result.stdout:
-                print(f"   📝 Output: {result.stdout}")
-    except subprocess.TimeoutExpired:
-        print(f"   ⏰ Timeout: Processing took longer than 60 seconds")
+        from main import process  # imported here, once PyPDF2 is known to be installed
+        process(documents=pdf_paths, persona=persona, job=job, output=str(output_file))
+        print(f"   ✅ Completed successfully -> {output_file}")
+        print(f"   📊 Results saved to: Output/challenge1b_output.json")
     except Exception as e:
         print(f"   ❌ Error: {e}")
 